@@ -92,6 +92,10 @@ class Config(metaclass=ConfigMeta):
     # Number of subdivisions for additional resolution.
     nvis = Setting(1)
 
+    # Logging verbosity. Checked before building expensive debug
+    # messages that would otherwise be formatted and discarded.
+    verbosity = Setting('info', Pipeline, name='--debug/--info/--user/--warning/--error')
+
     # Which fields to include
     field_filter = Setting(None, Pipeline, name='--filter')
 
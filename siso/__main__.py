@@ -5,16 +5,13 @@ import traceback
 import warnings
 
 import click
-import treelog as log
 
 from typing import Optional
 
-from . import config, ConfigSource
-from .coords import Coords, Local, Geocentric
-from .pipeline import pipeline
-from .util import split_commas
-from .reader import Reader
-from .writer import Writer
+# Note: all the heavy dependencies (readers, writers, coordinate
+# systems and the numerical stack they pull in) are imported inside
+# convert() instead of at module level, so that --help and tab
+# completion don't pay the full import cost.
 
 
 def suppress_warnings(func):
@@ -27,15 +24,20 @@ def suppress_warnings(func):
     return inner
 
 
-class RichOutputLog(log.RichOutputLog):
+def make_rich_logger(stream):
+    import treelog as log
 
-    def __init__(self, stream):
-        super().__init__()
-        self.stream = stream
+    class RichOutputLog(log.RichOutputLog):
 
-    def write(self, text, level):
-        message = ''.join([self._cmap[level.value], text, '\033[0m\n', self._current])
-        click.echo(message, file=self.stream, nl=False)
+        def __init__(self, stream):
+            super().__init__()
+            self.stream = stream
+
+        def write(self, text, level):
+            message = ''.join([self._cmap[level.value], text, '\033[0m\n', self._current])
+            click.echo(message, file=self.stream, nl=False)
+
+    return RichOutputLog(stream)
 
 
 class CoordsType(click.ParamType):
@@ -46,7 +48,8 @@ class CoordsType(click.ParamType):
     def convert(self, value, param, ctx):
         if value is None or value is False:
             return None
-        if value is None or isinstance(value, Coords):
+        from .coords import Coords
+        if isinstance(value, Coords):
             return value
         rval = Coords.find(value)
         return rval
@@ -54,6 +57,14 @@ class CoordsType(click.ParamType):
 
 FORMATS = ['vtf', 'vtk', 'vtu', 'vts', 'pvd', 'nc', 'dat']
 
+# Deprecated options and their replacements, warned about on use.
+DEPRECATED_OPTIONS = [
+    (('--global',), '--coords geocentric'),
+    (('--local',), '--coords local'),
+    (('--geometry', '-g'), '--coords'),
+    (('--endianness',), '--in-endianness'),
+]
+
 @click.command()
 @click.option('--fmt', '-f', type=click.Choice(FORMATS), required=False, help='Output format.')
 
@@ -85,10 +96,10 @@ FORMATS = ['vtf', 'vtk', 'vtu', 'vts', 'pvd', 'nc', 'dat']
 
 @click.option('--mesh', 'mesh_file', help='Name of mesh file.')
 
-@click.option('--geometry', '-g', 'coords', default=Local(), help='Use this basis to provide geometry.', type=CoordsType())
-@click.option('--local', 'coords', flag_value=Local(), help='Local (cartesian) mapping.', type=CoordsType())
-@click.option('--global', 'coords', flag_value=Geocentric(), help='Global (spherical) mapping.', type=CoordsType())
-@click.option('--coords', default=Local(), type=CoordsType())
+@click.option('--geometry', '-g', 'coords', default='local', help='Use this basis to provide geometry.', type=CoordsType())
+@click.option('--local', 'coords', flag_value='local', help='Local (cartesian) mapping.', type=CoordsType())
+@click.option('--global', 'coords', flag_value='geocentric', help='Global (spherical) mapping.', type=CoordsType())
+@click.option('--coords', default='local', type=CoordsType())
 @click.option('--in-coords', 'input_coords', nargs=2, multiple=True, type=click.Tuple([str, CoordsType()]))
 
 # Logging and verbosity
@@ -107,9 +118,17 @@ FORMATS = ['vtf', 'vtk', 'vtu', 'vts', 'pvd', 'nc', 'dat']
 
 @suppress_warnings
 def convert(ctx, verbosity, rich, infile, fmt, outfile, **kwargs):
+    # Deferred imports of the full conversion machinery
+    import treelog as log
+    from . import config, ConfigSource
+    from .pipeline import pipeline
+    from .util import split_commas
+    from .reader import Reader
+    from .writer import Writer
+
     # Set up logging
     if rich:
-        logger = RichOutputLog(sys.stdout)
+        logger = make_rich_logger(sys.stdout)
     else:
         logger = log.TeeLog(
             log.FilterLog(log.StdoutLog(), maxlevel=log.proto.Level.user),
@@ -118,14 +137,9 @@ def convert(ctx, verbosity, rich, infile, fmt, outfile, **kwargs):
     log.current = log.FilterLog(logger, minlevel=getattr(log.proto.Level, verbosity))
 
     # Print potential warnings
-    if '--global' in sys.argv:
-        log.warning(f"--global is deprecated; use --coords geocentric instead")
-    if '--local' in sys.argv:
-        log.warning(f"--local is deprecated; use --coords local instead")
-    if '--geometry' in sys.argv or '-g' in sys.argv:
-        log.warning(f"--geometry is deprecated; use --coords instead")
-    if '--endianness' in sys.argv:
-        log.warning(f"--endianness is deprecated; use --in-endianness instead")
+    for aliases, replacement in DEPRECATED_OPTIONS:
+        if any(alias in sys.argv for alias in aliases):
+            log.warning(f"{aliases[0]} is deprecated; use {replacement} instead")
 
     # Convert to pathlib
     infile = Path(infile)
@@ -146,11 +160,11 @@ def convert(ctx, verbosity, rich, infile, fmt, outfile, **kwargs):
     for k in ['field_filter', 'only_bases']:
         kwargs[k] = tuple(split_commas(kwargs[k]))
     if kwargs['no_fields']:
-        kwargs['field_filter'] = []
+        kwargs['field_filter'] = frozenset()
     elif ctx.get_parameter_source('field_filter') not in explicit:
         kwargs['field_filter'] = None
     else:
-        kwargs['field_filter'] = tuple(f.lower() for f in kwargs['field_filter'])
+        kwargs['field_filter'] = frozenset(f.strip().casefold() for f in kwargs['field_filter'])
     if isinstance(kwargs['timestep_index'], int):
         n = kwargs['timestep_index']
         kwargs['timestep_slice'] = f'{n}:{n+1}:1'
@@ -165,7 +179,7 @@ def convert(ctx, verbosity, rich, infile, fmt, outfile, **kwargs):
         # so apply it first.  Since kwargs may include options that
         # are not explicity set by the user, we set the source to
         # Default, and later use the upgrade_source method.
-        with config(source=ConfigSource.Default, **kwargs):
+        with config(source=ConfigSource.Default, verbosity=verbosity, **kwargs):
             for name in kwargs:
                 if ctx.get_parameter_source(name) in explicit:
                     config.upgrade_source(name, ConfigSource.User)
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from functools import cached_property
 from inspect import isabstract
 
 import erfa
@@ -11,7 +13,10 @@ from ..geometry import PatchKey
 from ..util import subclasses
 from .. import config
 
-from .util import spherical_cartesian_vf, utm_to_lonlat, utm_to_lonlat_vf, lonlat_to_utm, lonlat_to_utm_vf
+from .util import (
+    geodetic_to_geocentric, spherical_cartesian_vf,
+    utm_to_lonlat, utm_to_lonlat_vf, lonlat_to_utm, lonlat_to_utm_vf,
+)
 
 
 
@@ -52,7 +57,7 @@ class SphericalEllipsoid(Ellipsoid):
 
     name = 'sphere'
 
-    @property
+    @cached_property
     def parameters(self) -> Tuple[float, float]:
         mean_radius = 6_371_008.8
         return mean_radius, 0.0
@@ -62,8 +67,10 @@ class ERFAEllipsoid(Ellipsoid):
 
     erfa_code: int
 
-    @property
+    @cached_property
     def parameters(self) -> Tuple[float, float]:
+        # The erfa lookup is cheap but runs once per patch conversion,
+        # so cache it on the instance.
         return erfa.eform(self.erfa_code)
 
 
@@ -207,7 +214,12 @@ class ConversionGraph:
 
     # Keeps track of neighboring coordinate systems: those that can be
     # directly reached by one converter
-    neighbors: Dict[str, List[str]]
+    neighbors: List[List[int]]
+
+    # Maps coordinate system names to the small integer IDs used by the
+    # neighbor lists, assigned at registration time
+    _ids: Dict[str, int]
+    _names: List[str]
 
     # Keeps track of the actual point converter functions
     point_converters: ConvDict
@@ -215,21 +227,41 @@ class ConversionGraph:
     # Keeps track of the actual vector field converter functions
     vector_converters: ConvDict
 
+    # Caches discovered paths between coordinate system names, cleared
+    # whenever a new converter is registered
+    _paths: Dict[Tuple[str, str], List[str]]
+
     def __init__(self):
-        self.neighbors = dict()
+        self.neighbors = []
+        self._ids = dict()
+        self._names = []
         self.point_converters = dict()
         self.vector_converters = dict()
+        self._paths = dict()
+
+    def _node_id(self, name: str) -> int:
+        try:
+            return self._ids[name]
+        except KeyError:
+            self._ids[name] = nid = len(self._names)
+            self._names.append(name)
+            self.neighbors.append([])
+            return nid
+
+    def _register_edge(self, source: str, target: str):
+        self.neighbors[self._node_id(source)].append(self._node_id(target))
+        self._paths.clear()
 
     def points(self, source: str, target: str) -> Callable:
         def decorator(func: Callable) -> Callable:
-            self.neighbors.setdefault(source, []).append(target)
+            self._register_edge(source, target)
             self.point_converters[(source, target)] = func
             return func
         return decorator
 
     def vectors(self, source: str, target: str, trivial: bool = True) -> Callable:
         def decorator(func: Callable) -> Callable:
-            self.neighbors.setdefault(source, []).append(target)
+            self._register_edge(source, target)
             self.vector_converters[(source, target)] = func
             func.is_trivial = trivial
             return func
@@ -244,21 +276,35 @@ class ConversionGraph:
         if isinstance(source, Local) and target == Local('local'):
             return Converter(self, [])
 
-        seen: Set[str] = set()
-        front: Dict[str, List[str]] = {source.name: [source.name]}
-
-        while front:
-            new_front = dict()
-            for front_point, path in front.items():
-                for neighbor in self.neighbors.get(front_point, []):
-                    if neighbor in seen:
-                        continue
-                    seen.add(neighbor)
-                    new_path = [*path, neighbor]
-                    if neighbor == target.name:
+        cached = self._paths.get((source.name, target.name))
+        if cached is not None:
+            return Converter(self, cached)
+
+        src_id = self._ids.get(source.name)
+        tgt_id = self._ids.get(target.name)
+
+        if src_id is not None and tgt_id is not None:
+            # Breadth-first search over integer IDs, tracking the
+            # predecessor of each visited system in a flat array
+            parent = [-1] * len(self._names)
+            parent[src_id] = src_id
+            queue = deque([src_id])
+            while queue:
+                current = queue.popleft()
+                for neighbor in self.neighbors[current]:
+                    if neighbor == tgt_id:
+                        new_path = [self._names[tgt_id]]
+                        node = current
+                        while node != src_id:
+                            new_path.append(self._names[node])
+                            node = parent[node]
+                        new_path.append(self._names[src_id])
+                        new_path.reverse()
+                        self._paths[(source.name, target.name)] = new_path
                         return Converter(self, new_path)
-                    new_front[neighbor] = new_path
-            front = new_front
+                    if parent[neighbor] < 0:
+                        parent[neighbor] = current
+                        queue.append(neighbor)
 
         raise CoordinateConversionError(f"Unable to convert {source} to {target}")
 
@@ -284,11 +330,24 @@ class Converter:
 
     graph: ConversionGraph
     path: List[str]
+    intermediates: List[Coords]
+    edges: List[Tuple[str, str]]
+    point_funcs: List[Callable]
+    vector_funcs: List[Callable]
+    is_noop: bool
     nodes: Dict[Tuple[Tuple[str, str], PatchKey], Array2D]
 
     def __init__(self, graph: ConversionGraph, path: List[str]):
         self.graph = graph
         self.path = path
+        # The intermediate coordinate systems, edge keys and converter
+        # functions depend only on the path, so resolve them once
+        # instead of on every patch.
+        self.intermediates = [Coords.find(c) for c in path[1:-1]]
+        self.edges = list(zip(path[:-1], path[1:]))
+        self.point_funcs = [graph.point_converters[edge] for edge in self.edges]
+        self.vector_funcs = [graph.vector_converters[edge] for edge in self.edges]
+        self.is_noop = len(path) < 2
         self.nodes = dict()
 
     def __len__(self):
@@ -296,38 +355,44 @@ class Converter:
 
     @property
     def is_trivial(self):
-        return all(
-            self.graph.vector_converters[(a, b)].is_trivial
-            for a, b in zip(self.path[:-1], self.path[1:])
-        )
+        return all(func.is_trivial for func in self.vector_funcs)
 
-    def convert(self, src: Coords, tgt: Coords, data: Array2D, lookup: ConvDict, key: PatchKey, store: bool) -> Array2D:
-        if not self.path:
+    def convert(self, src: Coords, tgt: Coords, data: Array2D, funcs: List[Callable], key: PatchKey, store: bool) -> Array2D:
+        if self.is_noop:
             return data
-        path = [src] + [Coords.find(c) for c in self.path[1:-1]] + [tgt]
-        for a, b in zip(path[:-1], path[1:]):
-            edge = (a.name, b.name)
+        path = [src, *self.intermediates, tgt]
+        for (a, b), edge, func in zip(zip(path[:-1], path[1:]), self.edges, funcs):
             if store:
                 self.nodes[edge, key] = data
-                data = lookup[edge](a, b, data)
+                data = func(a, b, data)
             else:
-                data = lookup[edge](a, b, data, nodes=self.nodes[edge, key])
+                data = func(a, b, data, nodes=self.nodes[edge, key])
         return data
 
     def points(self, src: Coords, tgt: Coords, data: Array2D, key: PatchKey) -> Array2D:
-        return self.convert(src, tgt, data, self.graph.point_converters, key=key, store=True)
+        return self.convert(src, tgt, data, self.point_funcs, key=key, store=True)
 
     def vectors(self, src: Coords, tgt: Coords, data: Array2D, key: PatchKey) -> Array2D:
-        return self.convert(src, tgt, data, self.graph.vector_converters, key=key, store=False)
+        return self.convert(src, tgt, data, self.vector_funcs, key=key, store=False)
+
+
+def _replace_planar(x: Array2D, y: Array2D, data: Array2D) -> Array2D:
+    """Return a copy of DATA with the first two columns replaced by X
+    and Y, writing into a single preallocated array instead of stacking
+    reshaped column views.
+    """
+    retval = np.empty_like(data, dtype=float)
+    retval[:, 0] = x
+    retval[:, 1] = y
+    retval[:, 2:] = data[:, 2:]
+    return retval
 
 
 @graph.points('geodetic', 'geocentric')
 def _(src: Geodetic, tgt: Geocentric, data: Array2D) -> Array2D:
     lon, lat, h = data.T
-    lon = np.deg2rad(lon)
-    lat = np.deg2rad(lat)
     a, f = tgt.ellipsoid.parameters
-    return erfa.gd2gce(a, f, lon, lat, h)
+    return geodetic_to_geocentric(a, f, lon, lat, h)
 
 @graph.vectors('geodetic', 'geocentric', trivial=False)
 def _(src: Geodetic, tgt: Geocentric, data: Array2D, nodes: Array2D) -> Array2D:
@@ -337,19 +402,19 @@ def _(src: Geodetic, tgt: Geocentric, data: Array2D, nodes: Array2D) -> Array2D:
 @graph.points('utm', 'geodetic')
 def _(src: UTM, tgt: Geodetic, data: Array2D) -> Array2D:
     lon, lat = utm_to_lonlat(data[:,0], data[:,1], src.zone_number, src.zone_letter)
-    return np.hstack([lon.reshape(-1,1), lat.reshape(-1,1), data[:,2:]])
+    return _replace_planar(lon, lat, data)
 
 @graph.vectors('utm', 'geodetic', trivial=False)
 def _(src: UTM, tgt: Geodetic, data: Array2D, nodes: Array2D) -> Array2D:
     vx, vy = utm_to_lonlat_vf(nodes[:,0], nodes[:,1], data[:,0], data[:,1], src.zone_number, src.zone_letter)
-    return np.hstack([vx.reshape(-1,1), vy.reshape(-1,1), data[:,2:]])
+    return _replace_planar(vx, vy, data)
 
 @graph.points('geodetic', 'utm')
 def _(src: Geodetic, tgt: UTM, data: Array2D) -> Array2D:
     x, y = lonlat_to_utm(data[:,0], data[:,1], tgt.zone_number, tgt.zone_letter)
-    return np.hstack([x.reshape(-1,1), y.reshape(-1,1), data[:,2:]])
+    return _replace_planar(x, y, data)
 
 @graph.vectors('geodetic', 'utm')
 def _(src: Geodetic, tgt: UTM, data: Array2D, nodes: Array2D) -> Array2D:
     x, y = lonlat_to_utm_vf(nodes[:,0], nodes[:,1], data[:,0], data[:,1], tgt.zone_number, tgt.zone_letter)
-    return np.hstack([x.reshape(-1,1), y.reshape(-1,1), data[:,2:]])
+    return _replace_planar(x, y, data)
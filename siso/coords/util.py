@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+import erfa
 import numpy as np
 
 from ..typing import Array
@@ -10,32 +13,103 @@ except ImportError:
     HAS_JAX = False
     jnp = np
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+
+# Point counts above this threshold are worth the overhead of spinning
+# up the numba thread pool
+PARALLEL_THRESHOLD = 1 << 16
+
+
+def _gd2gce_loop(a, f, lon, lat, h, out):
+    # Closed-form geodetic to geocentric formula (same as erfa.gd2gce)
+    # for longitudes and latitudes already in radians, written with
+    # indexed loops so LLVM can auto-vectorize the trig pipeline.  The
+    # prange degrades to an ordinary range in the serial compilation.
+    e2 = f * (2.0 - f)
+    for i in prange(lon.shape[0]):
+        slat = np.sin(lat[i])
+        clat = np.cos(lat[i])
+        slon = np.sin(lon[i])
+        clon = np.cos(lon[i])
+        n = a / np.sqrt(1.0 - e2 * slat * slat)
+        r = (n + h[i]) * clat
+        out[i, 0] = r * clon
+        out[i, 1] = r * slon
+        out[i, 2] = (n * (1.0 - e2) + h[i]) * slat
+
+
+def _sph2cart_vf_loop(lon, lat, data, invert, out):
+    # Per-point rotation between spherical and Cartesian vector
+    # components, for longitudes and latitudes already in radians.
+    for i in prange(lon.shape[0]):
+        slon = np.sin(lon[i])
+        clon = np.cos(lon[i])
+        slat = np.sin(lat[i])
+        clat = np.cos(lat[i])
+        d0, d1, d2 = data[i, 0], data[i, 1], data[i, 2]
+        if invert:
+            out[i, 0] = -slon * d0 + clon * d1
+            out[i, 1] = -slat * clon * d0 - slat * slon * d1 + clat * d2
+            out[i, 2] = clat * clon * d0 + clat * slon * d1 + slat * d2
+        else:
+            out[i, 0] = -slon * d0 - slat * clon * d1 + clat * clon * d2
+            out[i, 1] = clon * d0 - slat * slon * d1 + clat * slon * d2
+            out[i, 2] = clat * d1 + slat * d2
+
+
+if HAS_NUMBA:
+    _gd2gce_kernel = njit(cache=True, fastmath=True)(_gd2gce_loop)
+    _gd2gce_kernel_parallel = njit(cache=True, fastmath=True, parallel=True)(_gd2gce_loop)
+    _sph2cart_vf_kernel = njit(cache=True, fastmath=True)(_sph2cart_vf_loop)
+    _sph2cart_vf_kernel_parallel = njit(cache=True, fastmath=True, parallel=True)(_sph2cart_vf_loop)
+
+
+def geodetic_to_geocentric(a: float, f: float, lon: Array, lat: Array, h: Array) -> Array:
+    """Convert geodetic coordinates (in degrees) on a reference ellipsoid
+    with semi-major axis A and flattening F to geocentric coordinates.
+    """
+    if HAS_NUMBA:
+        # Scale to radians before widening to double so that
+        # single-precision inputs round exactly as in the erfa path
+        out = np.empty((len(lon), 3), dtype=float)
+        kernel = _gd2gce_kernel_parallel if len(lon) > PARALLEL_THRESHOLD else _gd2gce_kernel
+        kernel(float(a), float(f), np.asarray(np.deg2rad(lon), dtype=float),
+               np.asarray(np.deg2rad(lat), dtype=float), np.asarray(h, dtype=float), out)
+        return out
+    return erfa.gd2gce(a, f, np.deg2rad(lon), np.deg2rad(lat), h)
+
 
 
 def spherical_cartesian_vf(lon: Array, lat: Array, data: Array, invert: bool = False) -> Array:
     """Convert a spherical vector field to a Cartesian vector field or back. """
+    if HAS_NUMBA and data.ndim == 2 and np.ndim(lon) == 1 and len(lon) == len(data):
+        out = np.empty_like(data, dtype=float)
+        kernel = _sph2cart_vf_kernel_parallel if len(lon) > PARALLEL_THRESHOLD else _sph2cart_vf_kernel
+        kernel(np.asarray(np.deg2rad(lon), dtype=float), np.asarray(np.deg2rad(lat), dtype=float),
+               np.asarray(data, dtype=float), invert, out)
+        return out
+
     lon = np.deg2rad(lon)
     lat = np.deg2rad(lat)
     clon, clat = np.cos(lon), np.cos(lat)
     slon, slat = np.sin(lon), np.sin(lat)
+    d0, d1, d2 = data[..., 0], data[..., 1], data[..., 2]
 
-    retval = np.zeros_like(data)
-    retval[..., 0] -= slon * data[..., 0]
-    retval[..., 1] -= slat * slon * data[..., 1]
-    retval[..., 2] += slat * data[..., 2]
-
+    retval = np.empty_like(data)
     if invert:
-        retval[..., 1] -= slat * clon * data[..., 0]
-        retval[..., 2] += clat * clon * data[..., 0]
-        retval[..., 0] += clon * data[..., 1]
-        retval[..., 2] += clat * slon * data[..., 1]
-        retval[..., 1] += clat * data[..., 2]
+        retval[..., 0] = -slon * d0 + clon * d1
+        retval[..., 1] = -slat * clon * d0 - slat * slon * d1 + clat * d2
+        retval[..., 2] = clat * clon * d0 + clat * slon * d1 + slat * d2
     else:
-        retval[..., 0] -= slat * clon * data[..., 1]
-        retval[..., 0] += clat * clon * data[..., 2]
-        retval[..., 1] += clon * data[..., 0]
-        retval[..., 1] += clat * slon * data[..., 2]
-        retval[..., 2] += clat * data[..., 1]
+        retval[..., 0] = -slon * d0 - slat * clon * d1 + clat * clon * d2
+        retval[..., 1] = clon * d0 - slat * slon * d1 + clat * slon * d2
+        retval[..., 2] = clat * d1 + slat * d2
 
     return retval
 
@@ -85,14 +159,27 @@ def normalize_pair(x, y):
     norm = np.sqrt(x**2 + y**2)
     return x / norm, y / norm
 
+@lru_cache(maxsize=None)
+def _utm_to_lonlat_grads(zone: int, zone_letter: str):
+    # Building the vmapped gradient functions forces a retrace on every
+    # call, so construct them once per zone.
+    lon = lambda x, y: _utm_to_lonlat(x, y, zone, zone_letter)[0]
+    lat = lambda x, y: _utm_to_lonlat(x, y, zone, zone_letter)[1]
+    return jax.vmap(jax.grad(lon, (0, 1))), jax.vmap(jax.grad(lat, (0, 1)))
+
+@lru_cache(maxsize=None)
+def _lonlat_to_utm_grads(zone: int, zone_letter: str):
+    x = lambda lon, lat: _lonlat_to_utm(lon, lat, zone, zone_letter)[0]
+    y = lambda lon, lat: _lonlat_to_utm(lon, lat, zone, zone_letter)[1]
+    return jax.vmap(jax.grad(x, (0, 1))), jax.vmap(jax.grad(y, (0, 1)))
+
 def utm_to_lonlat_vf(x: Array, y: Array, vx: Array, vy: Array, zone: int, zone_letter: str) -> Array:
     if not HAS_JAX:
         raise TypeError(f"An autodifferentiation package must be installed for UTM vector field conversion, try pip install 'siso[autodiff]'")
     x, y = jnp.array(x), jnp.array(y)
-    lon = lambda x, y: _utm_to_lonlat(x, y, zone, zone_letter)[0]
-    lat = lambda x, y: _utm_to_lonlat(x, y, zone, zone_letter)[1]
-    dlon_dx, dlon_dy = jax.vmap(jax.grad(lon, (0, 1)))(x, y)
-    dlat_dx, dlat_dy = jax.vmap(jax.grad(lat, (0, 1)))(x, y)
+    grad_lon, grad_lat = _utm_to_lonlat_grads(zone, zone_letter)
+    dlon_dx, dlon_dy = grad_lon(x, y)
+    dlat_dx, dlat_dy = grad_lat(x, y)
     dlon_dx, dlon_dy = normalize_pair(dlon_dx, dlon_dy)
     dlat_dx, dlat_dy = normalize_pair(dlat_dx, dlat_dy)
     return dlon_dx * vx + dlon_dy * vy, dlat_dx * vx + dlat_dy * vy
@@ -104,10 +191,9 @@ def lonlat_to_utm_vf(x: Array, y: Array, vx: Array, vy: Array, zone: int, zone_l
     if not HAS_JAX:
         raise TypeError(f"An autodifferentiation package must be installed for UTM vector field conversion, try pip install 'siso[autodiff]'")
     lon, lat = jnp.array(x), jnp.array(y)
-    x = lambda lon, lat: _lonlat_to_utm(lon, lat, zone, zone_letter)[0]
-    y = lambda lon, lat: _lonlat_to_utm(lon, lat, zone, zone_letter)[1]
-    dx_dlon, dx_dlat = jax.vmap(jax.grad(x, (0, 1)))(lon, lat)
-    dy_dlon, dy_dlat = jax.vmap(jax.grad(y, (0, 1)))(lon, lat)
+    grad_x, grad_y = _lonlat_to_utm_grads(zone, zone_letter)
+    dx_dlon, dx_dlat = grad_x(lon, lat)
+    dy_dlon, dy_dlat = grad_y(lon, lat)
     dx_dlon, dx_dlat = normalize_pair(dx_dlon, dx_dlat)
     dy_dlon, dy_dlat = normalize_pair(dy_dlon, dy_dlat)
     return dx_dlon * vx + dx_dlat * vy, dy_dlon * vx + dy_dlat * vy
@@ -76,7 +76,9 @@ class Field(ABC):
     @property
     def fieldtype(self) -> FieldType:
         if self._fieldtype is None:
-            return Vector() if self.ncomps > 1 else Scalar()
+            # Memoize the default so that repeated is_scalar/is_vector
+            # checks don't construct a fresh fieldtype every time
+            self._fieldtype = Vector() if self.ncomps > 1 else Scalar()
         return self._fieldtype
 
     @fieldtype.setter
@@ -129,7 +131,9 @@ class SourcedField(Field):
 
     @property
     def fieldtype(self) -> FieldType:
-        if hasattr(self, '_fieldtype') and self._fieldtype is not None:
+        # The hasattr check was redundant: Field defines _fieldtype as
+        # a class attribute, so the slot always exists
+        if self._fieldtype is not None:
             return self._fieldtype
         return self.src.fieldtype
 
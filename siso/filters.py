@@ -142,22 +142,29 @@ class TesselatedField(SourcedField):
             yield TesselatedField(field, self.manager)
 
     def patches(self, stepid: int, force: bool = False, coords: Optional[Coords] = None) -> FieldPatches:
+        # These don't change between patches, so resolve the property
+        # chains through the source field only once
+        is_geometry = self.is_geometry
+        is_simple = isinstance(self.src, SimpleField)
+        is_combined = isinstance(self.src, CombinedField)
+        cells = self.cells
+
         for patchdata, fielddata in self.src.patches(stepid, force=force, coords=coords):
             key = patchdata.key if isinstance(patchdata, Patch) else patchdata[0].key
 
-            if self.is_geometry:
+            if is_geometry:
                 patchid = self.manager.update(key, fielddata)
                 topo = patchdata.topology.tesselate()
                 data = patchdata.topology.tesselate_field(fielddata)
                 yield Patch((patchid,), topo), data
 
-            elif isinstance(self.src, SimpleField):
+            elif is_simple:
                 patchid = self.manager.global_id(key)
-                yield Patch((patchid,)), patchdata.topology.tesselate_field(fielddata, cells=self.cells)
+                yield Patch((patchid,)), patchdata.topology.tesselate_field(fielddata, cells=cells)
 
-            elif isinstance(self.src, CombinedField):
+            elif is_combined:
                 patchid = self.manager.global_id(key)
-                data = np.hstack([p.topology.tesselate_field(d, cells=self.cells) for p, d in zip(patchdata, fielddata)])
+                data = np.hstack([p.topology.tesselate_field(d, cells=cells) for p, d in zip(patchdata, fielddata)])
                 yield Patch((patchid,)), data
 
             else:
@@ -219,28 +226,22 @@ class MergeTopologiesField(SourcedField):
 
     def patches(self, stepid: int, force: bool = False, coords: Optional[Coords] = None) -> FieldPatches:
         # TODO: Find a way to get this information without the data
+        chunks = []
         if self.is_geometry:
-            topo = None
+            topos = []
             for patch, data in self.src.patches(stepid, force=force, coords=coords):
                 self.manager.set_indices(stepid, patch.key, len(data))
-                if topo is None:
-                    topo = patch.topology
-                else:
-                    assert isinstance(topo, UnstructuredTopology)
-                    assert isinstance(patch.topology, UnstructuredTopology)
-                    topo = UnstructuredTopology.join(topo, patch.topology)
-            if topo is not None:
-                self.manager.topology = topo
-
-        nnodes = self.manager.next_index
-        total_data = None
-        for patch, data in self.src.patches(stepid, force=force, coords=coords):
-            if total_data is None:
-                total_data = data
-            else:
-                total_data = np.vstack((total_data, data))
+                topos.append(patch.topology)
+                chunks.append(data)
+            if topos:
+                assert len(topos) == 1 or all(isinstance(topo, UnstructuredTopology) for topo in topos)
+                self.manager.topology = UnstructuredTopology.join_all(topos)
+        else:
+            for patch, data in self.src.patches(stepid, force=force, coords=coords):
+                chunks.append(data)
 
-        if total_data is not None:
+        if chunks:
+            total_data = chunks[0] if len(chunks) == 1 else np.vstack(chunks)
             yield Patch((0,), self.manager.topology), total_data
 
 
@@ -269,8 +270,15 @@ class CoordinateTransformFilter(Source):
             if fld.is_geometry:
                 try:
                     converter = graph.path(fld.coords, self.target)
-                    path = ' -> '.join(str(k) for k in [fld.coords, *converter.path[1:-1], self.target])
-                    log.debug(f"Coordinate conversion path: {path}")
+                    if self.converter is None:
+                        # The first accepted geometry is the one the pipeline
+                        # uses, so share its conversion path with the patch
+                        # conversion instead of recomputing it there.
+                        self.converter = converter
+                        self.source_coords = fld.coords
+                    if config.verbosity == 'debug':
+                        path = ' -> '.join(str(k) for k in [fld.coords, *converter.path[1:-1], self.target])
+                        log.debug(f"Coordinate conversion path: {path}")
                     yield CoordinateTransformGeometryField(fld, self)
                 except CoordinateConversionError:
                     log.warning(f"Skipping {fld.name}: {fld.coords} not convertable to {self.target}")
@@ -312,8 +320,9 @@ class CoordinateTransformField(SourcedField):
 
     def patches(self, stepid: int, force: bool = False, coords: Optional[Coords] = None) -> FieldPatches:
         conv = self.manager.converter
+        is_vector = self.is_vector
         for patch, data in self.src.patches(stepid, force=force, coords=coords):
-            if self.is_vector:
+            if is_vector:
                 yield patch, conv.vectors(self.manager.source_coords, self.manager.target, data, patch.key)
             else:
                 yield patch, data
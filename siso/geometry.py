@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from io import StringIO
+from itertools import islice
 
 from dataclasses import dataclass
 import lrspline as lr
@@ -146,12 +147,25 @@ class UnstructuredTopology(Topology):
 
     @classmethod
     def join(cls, left: 'UnstructuredTopology', right: 'UnstructuredTopology') -> 'UnstructuredTopology':
-        assert left.celltype == right.celltype
-        return cls(
-            left.num_nodes + right.num_nodes,
-            np.vstack((left.cells, right.cells + left.num_nodes)),
-            left.celltype
-        )
+        return cls.join_all((left, right))
+
+    @classmethod
+    def join_all(cls, topos: Iterable['UnstructuredTopology']) -> 'UnstructuredTopology':
+        """Join a sequence of topologies into one, concatenating the
+        cell arrays in a single pass.  A lone topology is returned
+        unchanged without copying.
+        """
+        topos = list(topos)
+        if len(topos) == 1:
+            return topos[0]
+        celltype = topos[0].celltype
+        assert all(topo.celltype == celltype for topo in topos)
+
+        num_nodes, offset_cells = 0, []
+        for topo in topos:
+            offset_cells.append(topo.cells + num_nodes if num_nodes else topo.cells)
+            num_nodes += topo.num_nodes
+        return cls(num_nodes, np.vstack(offset_cells), celltype)
 
     @classmethod
     def from_lagrangian(cls, data: BinaryIO) -> Tuple['UnstructuredTopology', Array2D]:
@@ -170,16 +184,15 @@ class UnstructuredTopology(Topology):
         if celltype not in (b'hexahedron',):
             raise ValueError("Unknown cell type: {}".format(celltype.decode()))
 
-        # Read nodes and cells
-        nodes = np.zeros((nnodes, 3))
-        for i in range(nnodes):
-            nodes[i] = list(map(float, next(data).split()))
+        # Read nodes and cells, parsing whole blocks of lines at once
+        # instead of row by row in Python
+        nodes = np.fromstring(b' '.join(islice(data, nnodes)), sep=' ')
+        nodes = nodes.reshape(nnodes, 3)
 
-        cells = np.zeros((ncells, 8), dtype=np.int32)
-        for i in range(ncells):
-            cells[i] = list(map(int, next(data).split()))
-            cells[i,6], cells[i,7] = cells[i,7], cells[i,6]
-            cells[i,2], cells[i,3] = cells[i,3], cells[i,2]
+        cells = np.fromstring(b' '.join(islice(data, ncells)), dtype=np.int32, sep=' ')
+        cells = cells.reshape(ncells, 8)
+        cells[:, [6, 7]] = cells[:, [7, 6]]
+        cells[:, [2, 3]] = cells[:, [3, 2]]
 
         return cls(nnodes, cells, celltype=Hex()), nodes
 
@@ -223,12 +236,18 @@ class StructuredTopology(UnstructuredTopology):
         self.celltype = celltype
         self.shape = shape
         self._num_nodes = prod(k+1 for k in shape)
+        self._cells = None
         assert celltype.structured
         assert len(shape) == celltype.num_pardim
 
     @property
     def cells(self) -> Array2D:
-        return structured_cells(self.shape, self.num_pardim)
+        # The cell array depends only on the shape, but the property
+        # may be consulted once per field per step, so build it lazily
+        # and keep it
+        if self._cells is None:
+            self._cells = structured_cells(self.shape, self.num_pardim)
+        return self._cells
 
     @property
     def num_cells(self) -> int:
@@ -257,7 +276,13 @@ class LRTopology(Topology):
     def from_string(cls, data: Union[bytes, str]) -> Iterable[Tuple['LRTopology', Array2D]]:
         if isinstance(data, bytes):
             data = data.decode()
-        data = StringIO(data)
+        yield from cls.from_stream(StringIO(data))
+
+    @classmethod
+    def from_stream(cls, data: IO) -> Iterable[Tuple['LRTopology', Array2D]]:
+        """Read patches directly from an open stream, without requiring the
+        whole file to be materialized as a string first.
+        """
         for i, obj in enumerate(lr.LRSplineObject.read_many(data)):
             cps = obj.controlpoints.reshape(-1, obj.dimension)
 
@@ -306,6 +331,7 @@ class LRTopology(Topology):
 class LRTesselator(Tesselator):
 
     weights: Optional[np.ndarray]
+    cell_indices: Optional[np.ndarray]
 
     def __init__(self, topo: LRTopology, weights: Optional[np.ndarray]):
         super().__init__(topo)
@@ -317,6 +343,7 @@ class LRTesselator(Tesselator):
         self.nodes = np.array(list(nodes))
         self.cells = np.array(cells, dtype=int)
         self.weights = weights
+        self.cell_indices = None
 
     @singledispatchmethod
     def tesselate(self, topo: Topology) -> UnstructuredTopology:
@@ -354,10 +381,13 @@ class LRTesselator(Tesselator):
             return evaluated
 
         # For every cell center, check which cell it belongs to in the
-        # reference spline, then use that coefficient.
+        # reference spline, then use that coefficient.  The element
+        # lookup is static for a given tesselation, so do it only once.
+        if self.cell_indices is None:
+            cell_centers = (np.mean(self.nodes[c,:], axis=0) for c in self.cells)
+            self.cell_indices = np.array([spline.element_at(*c).id for c in cell_centers], dtype=int)
         coeffs = flatten_2d(coeffs)
-        cell_centers = [np.mean(self.nodes[c,:], axis=0) for c in self.cells]
-        return np.array([coeffs[spline.element_at(*c).id, :] for c in cell_centers])
+        return coeffs[self.cell_indices, :]
 
 
 
@@ -376,6 +406,39 @@ class G2Object(splipy.io.G2):
     def __enter__(self) -> 'G2Object':
         return self
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        # The stream is owned by the caller: don't close it.
+        pass
+
+    def read_iter(self) -> Iterable[SplineObject]:
+        """Read objects lazily, one at a time.  Unlike read(), this does not
+        materialize the whole file before yielding the first object.
+        """
+        if self.onlywrite:
+            raise IOError("Unable to read from write-only stream")
+
+        for line in self.fstream:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Read object type
+            objtype, major, minor, patch = map(int, line.split())
+            if (major, minor, patch) != (1, 0, 0):
+                raise IOError("Unknown G2 format")
+
+            # If the object type is in factory methods (circle, torus etc.), create it now
+            if objtype in self.g2_generators:
+                constructor = getattr(self, self.g2_generators[objtype].__name__)
+                yield constructor()
+                continue
+
+            # For "normal" splines (curves, surfaces, volumes) create it now
+            pardim = [i for i in range(len(self.g2_type)) if self.g2_type[i] == objtype]
+            if not pardim:
+                raise IOError(f"Unknown G2 object type {objtype}")
+            yield self.splines(pardim[0] + 1)
+
 
 class SplineTopology(Topology):
     """A representation of a Splipy SplineObject."""
@@ -391,9 +454,15 @@ class SplineTopology(Topology):
     def from_string(cls, data: Union[bytes, str]) -> Iterable[Tuple['SplinePatch', Array2D]]:
         if isinstance(data, bytes):
             data = data.decode()
-        g2data = StringIO(data)
-        with G2Object(g2data, 'r') as g:
-            for i, obj in enumerate(g.read()):
+        yield from cls.from_stream(StringIO(data))
+
+    @classmethod
+    def from_stream(cls, data: IO) -> Iterable[Tuple['SplinePatch', Array2D]]:
+        """Read patches one at a time from an open stream, so that each raw
+        splipy object can be released after conversion.
+        """
+        with G2Object(data, 'r') as g:
+            for obj in g.read_iter():
                 cps = flatten_2d(transpose_butlast(obj.controlpoints))
                 weights = None
                 if obj.rational:
@@ -438,9 +507,14 @@ class SplineTopology(Topology):
 
 class TensorTesselator(Tesselator):
 
+    cell_bases: Optional[List[BSplineBasis]]
+    cell_knots: Optional[List[List[float]]]
+
     def __init__(self, topo: SplineTopology):
         super().__init__(topo)
         self.knots = list(subdivide_linear(b.knot_spans(), config.nvis) for b in topo.bases)
+        self.cell_bases = None
+        self.cell_knots = None
 
     @singledispatchmethod
     def tesselate(self, topo: Topology) -> Topology:
@@ -473,12 +547,17 @@ class TensorTesselator(Tesselator):
 
         else:
             # Create a piecewise constant spline object, and evaluate
-            # it in cell centers.
-            bases = [BSplineBasis(1, b.knot_spans()) for b in topo.bases]
+            # it in cell centers.  The constant bases and the cell
+            # center knots are static for a given tesselation, so
+            # build them only once.
+            if self.cell_bases is None:
+                self.cell_bases = [BSplineBasis(1, b.knot_spans()) for b in topo.bases]
+                self.cell_knots = [[(a+b)/2 for a, b in zip(t[:-1], t[1:])] for t in self.knots]
+            bases = self.cell_bases
             shape = tuple(b.num_functions() for b in bases)
             coeffs = splipy.utils.reshape(coeffs, shape, order='F')
             newspline = SplineObject(bases, coeffs, False, raw=True)
-            knots = [[(a+b)/2 for a, b in zip(t[:-1], t[1:])] for t in self.knots]
+            knots = self.cell_knots
 
         return flatten_2d(newspline(*knots))
 
@@ -496,11 +575,14 @@ class GeometryManager:
         self.patch_keys = dict()
 
     def id_by_key(self, key: PatchKey):
+        # This runs once per patch per field, so probe with .get
+        # instead of paying for an exception at every prefix level
+        patch_keys = self.patch_keys
         while key:
-            try:
-                return self.patch_keys[key]
-            except KeyError:
-                key = key[:-1]
+            patchid = patch_keys.get(key)
+            if patchid is not None:
+                return patchid
+            key = key[:-1]
         raise KeyError
 
     def update(self, key: PatchKey, data: Array2D) -> int:
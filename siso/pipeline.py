@@ -15,33 +15,37 @@ from .writer import Writer
 
 
 def discover_decompositions(fields: List[Field]) -> Iterable[Field]:
+    debug = config.verbosity == 'debug'
     for field in fields:
         yield field
         for subfield in field.decompositions():
-            log.debug(f"Discovered decomposed scalar field '{subfield.name}'")
+            if debug:
+                log.debug(f"Discovered decomposed scalar field '{subfield.name}'")
             yield subfield
 
 
 def discover_fields(reader: Reader) -> Tuple[List[Field], List[Field]]:
+    # Traverse the source field iterator only once: readers may re-read
+    # metadata from disk for every pass, so log as we go instead of
+    # re-iterating the collected lists afterwards.
+    debug = config.verbosity == 'debug'
     geometries, fields = [], []
     for field in reader.fields():
         if field.is_geometry:
+            if debug:
+                log.debug(f"Discovered geometry '{field.name}' with coordinates {field.coords}")
             geometries.append(field)
             continue
-        if config.field_filter is not None and field.name.lower() not in config.field_filter:
+        if config.field_filter is not None and field.name.casefold() not in config.field_filter:
             continue
+        if debug:
+            log.debug(f"Discovered field '{field.name}' with {field.ncomps} component(s)")
         fields.append(field)
 
-    for field in fields:
-        log.debug(f"Discovered field '{field.name}' with {field.ncomps} component(s)")
-
     fields = sorted(fields, key=attrgetter('name'))
     fields = sorted(fields, key=attrgetter('cells'))
     fields = list(discover_decompositions(fields))
 
-    for field in geometries:
-        log.debug(f"Discovered geometry '{field.name}' with coordinates {field.coords}")
-
     return geometries, fields
 
 
@@ -54,20 +58,36 @@ def pick_geometry(geometries: List[Field]) -> Tuple[Field, Converter]:
     return geometries[index], converter
 
 
-def pipeline(reader: Source, writer: Writer):
-    """Main driver for moving data from reader to writer."""
+# Table of filters to attach to the source, in order.  Each entry is a
+# predicate deciding whether the filter applies, a constructor taking
+# the source, and a name for logging purposes.
+FILTER_RULES = [
+    (lambda writer: config.only_final_timestep,
+     LastStepFilter, 'LastStep'),
+    (lambda writer: not config.only_final_timestep and config.timestep_slice is not None,
+     lambda src: StepSliceFilter(src, *map(int, config.timestep_slice.split(':'))), 'StepSlice'),
+    (lambda writer: True,
+     TesselatorFilter, 'Tesselator'),
+    (lambda writer: writer.writer_name != 'VTF',
+     MergeTopologiesFilter, 'MergeTopologies'),
+    (lambda writer: True,
+     lambda src: CoordinateTransformFilter(src, config.coords), 'CoordinateTransform'),
+]
+
+
+def apply_filters(reader: Source, writer: Writer) -> Source:
+    """Attach the applicable filters from FILTER_RULES to a source."""
+    for predicate, construct, name in FILTER_RULES:
+        if predicate(writer):
+            log.debug(f"Attaching filter: {name}")
+            reader = construct(reader)
+    return reader
 
-    # TODO: Streamline filter application
-    if config.only_final_timestep:
-        reader = LastStepFilter(reader)
-    elif config.timestep_slice is not None:
-        reader = StepSliceFilter(reader, *map(int, config.timestep_slice.split(':')))
-    reader = TesselatorFilter(reader)
 
-    if writer.writer_name != 'VTF':
-        reader = MergeTopologiesFilter(reader)
+def pipeline(reader: Source, writer: Writer):
+    """Main driver for moving data from reader to writer."""
 
-    reader = CoordinateTransformFilter(reader, config.coords)
+    reader = apply_filters(reader, writer)
     geometries, fields = discover_fields(reader)
     if not geometries:
         raise ValueError(f"Unable to find any useful geometry fields")
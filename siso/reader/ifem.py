@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from functools import lru_cache
 from io import BytesIO
 from itertools import chain, count
@@ -91,21 +92,33 @@ class Basis(ABC):
     def num_updates(self) -> int:
         pass
 
-    @cache(1)
-    def patch_at(self, stepid: int, patchid: int) -> Tuple[Patch, Array2D]:
+    def last_update_before(self, stepid: int) -> int:
+        """Return the last step at or before STEPID where this basis updated."""
         while not self.update_at(stepid):
             stepid -= 1
+        return stepid
+
+    def patch_at(self, stepid: int, patchid: int) -> Tuple[Patch, Array2D]:
+        # Resolve to the step the basis last updated before consulting
+        # the cache, so that all steps (and all fields probing their
+        # own first update step) share one cache entry per patch
+        # instead of re-parsing the same blob under different step IDs
+        return self._parse_patch_at(self.last_update_before(stepid), patchid)
 
+    @cache(1)
+    def _parse_patch_at(self, stepid: int, patchid: int) -> Tuple[Patch, Array2D]:
         subpath = self.group_path(stepid)
-        patchdata = self.reader.h5[f'{subpath}/{patchid+1}'][:]
-        initial = patchdata[:20].tobytes()
-        g2bytes = BytesIO(memoryview(patchdata))
-        if initial.startswith(b'# LAGRANGIAN'):
-            topo, nodes = UnstructuredTopology.from_lagrangian(g2bytes)
-        elif initial.startswith(b'# LRSPLINE'):
-            topo, nodes = next(LRTopology.from_string(g2bytes.read()))
+        patchdata = self.reader.dataset(f'{subpath}/{patchid+1}')[:]
+        # Convert the blob to bytes once and hand it to the parsers
+        # directly: going through BytesIO copied the buffer again on
+        # construction and a third time on read()
+        raw = patchdata.tobytes()
+        if raw.startswith(b'# LAGRANGIAN'):
+            topo, nodes = UnstructuredTopology.from_lagrangian(BytesIO(raw))
+        elif raw.startswith(b'# LRSPLINE'):
+            topo, nodes = next(LRTopology.from_string(raw))
         else:
-            topo, nodes = next(SplineTopology.from_string(g2bytes.read()))
+            topo, nodes = next(SplineTopology.from_string(raw))
 
         oldkey = (self.name, patchid)
         newkey = self.reader.patch_catalogue.setdefault(nodes, oldkey)
@@ -119,24 +132,33 @@ class StandardBasis(Basis):
     reader: 'IFEMReader'
 
     update_steps: Set[int]
+    _sorted_updates: List[int]
     npatches: int
 
     def __init__(self, name: str, reader: 'IFEMReader'):
         super().__init__(name, reader)
 
-        # Find out at which steps this basis updates, and how many patches it has
+        # Find out at which steps this basis updates, and how many patches it has.
+        # Iterate over step IDs directly: reader.steps() would read the
+        # time information from file once per step for every basis.
         self.update_steps = set()
         self.npatches = 0
-        for i, _ in reader.steps():
+        for i in range(reader.nsteps):
             subpath = self.group_path(i)
             if subpath not in reader.h5:
                 continue
             self.update_steps.add(i)
             self.npatches = max(self.npatches, len(reader.h5[subpath]))
+        self._sorted_updates = sorted(self.update_steps)
 
     def group_path(self, stepid: int) -> str:
         return f'{self.reader.stepgroup[stepid]}/{self.name}/basis'
 
+    def last_update_before(self, stepid: int) -> int:
+        # The update steps are known up front, so bisect instead of
+        # walking backwards step by step
+        return self._sorted_updates[bisect_right(self._sorted_updates, stepid) - 1]
+
     def update_at(self, stepid: int) -> bool:
         return stepid in self.update_steps
 
@@ -154,6 +176,9 @@ class EigenBasis(Basis):
     def group_path(self, stepid: int) -> str:
         return f'0/{self.name}/basis'
 
+    def last_update_before(self, stepid: int) -> int:
+        return 0
+
     def update_at(self, stepid: int) -> bool:
         return stepid == 0
 
@@ -225,6 +250,9 @@ class IFEMField(SimpleField):
     def update_at(self, stepid: int) -> bool:
         return self.group_path(stepid) in self.reader.h5
 
+    # The group path is a pure function of the step ID, but it's
+    # rebuilt once per patch through coeff_path, so memoize it
+    @cache(1)
     def group_path(self, stepid: int) -> str:
         celltype = 'knotspan' if self.cells else 'fields'
         return f'{self.reader.stepgroup[stepid]}/{self.basisname}/{celltype}/{self.name}'
@@ -233,7 +261,7 @@ class IFEMField(SimpleField):
         return f'{self.group_path(stepid)}/{patchid+1}'
 
     def coeffs(self, stepid: int, patchid: int) -> Array2D:
-        coeffs = self.reader.h5[self.coeff_path(stepid, patchid)][:]
+        coeffs = self.reader.dataset(self.coeff_path(stepid, patchid))[:]
         return coeffs.reshape((-1, self.ncomps))
 
 
@@ -244,6 +272,7 @@ class EigenField(IFEMField):
         self.fieldtype = Displacement()
         self.decompose = False
 
+    @cache(1)
     def group_path(self, stepid: int) -> str:
         return f'0/{self.basis.name}/Eigenmode/{stepid+1}'
 
@@ -254,7 +283,7 @@ class EigenField(IFEMField):
         coeffs = super().coeffs(stepid, patchid)
         coeffs = ensure_ncomps(coeffs, 3, False)
         if self.ncomps == 1:
-            coeffs[:, -1] = coeffs[:, 0].copy()
+            coeffs[:, -1] = coeffs[:, 0]
             coeffs[:, 0] = 0
         return coeffs
 
@@ -274,6 +303,8 @@ class IFEMReader(Reader):
     bases: Dict[str, Basis]
     _fields: Dict[str, Field]
     _field_basis: Dict[str, str]
+    _datasets: Dict[str, h5py.Dataset]
+    _stepdata: Dict[int, StepData]
     stepgroup: List[int]
 
     patch_catalogue: PatchCatalogue
@@ -293,6 +324,8 @@ class IFEMReader(Reader):
         self.bases = dict()
         self._fields = dict()
         self._field_basis = dict()
+        self._datasets = dict()
+        self._stepdata = dict()
         self.patch_catalogue = PatchCatalogue()
 
     def validate(self):
@@ -304,8 +337,15 @@ class IFEMReader(Reader):
         )
 
     def __enter__(self):
-        self.h5 = h5py.File(str(self.filename), 'r').__enter__()
-        self.stepgroup = sorted(list(map(int, self.h5)))
+        # The h5py default chunk cache is 1 MiB per dataset, which
+        # large coefficient datasets easily exceed, forcing chunks to
+        # be re-read.  Size the cache generously: it only costs memory
+        # for chunks actually read.
+        self.h5 = h5py.File(
+            str(self.filename), 'r',
+            rdcc_nbytes=64 * 1024 * 1024, rdcc_nslots=8191,
+        ).__enter__()
+        self.stepgroup = sorted(map(int, self.h5))
 
         # Populate self.bases
         self.init_bases()
@@ -319,8 +359,20 @@ class IFEMReader(Reader):
         return self
 
     def __exit__(self, *args):
+        self._datasets.clear()
         self.h5.__exit__(*args)
 
+    def dataset(self, path: str) -> h5py.Dataset:
+        """Return the dataset at PATH, caching the h5py proxy object.
+
+        Indexing the file rebuilds the proxy and re-traverses the path
+        on every access, which adds up for the small per-patch reads.
+        """
+        dset = self._datasets.get(path)
+        if dset is None:
+            self._datasets[path] = dset = self.h5[path]
+        return dset
+
     @property
     def nsteps(self) -> int:
         """Return number of steps in the data set."""
@@ -329,7 +381,18 @@ class IFEMReader(Reader):
     def stepdata(self, stepid: int) -> StepData:
         """Return the data associated with a step (time, eigenvalue or
         frequency).
+
+        The result is memoized: steps() is iterated in full several
+        times (field discovery, filters, the pipeline itself), and
+        each scalar read from the file costs far more than the value
+        it returns.
         """
+        data = self._stepdata.get(stepid)
+        if data is None:
+            self._stepdata[stepid] = data = self._read_stepdata(stepid)
+        return data
+
+    def _read_stepdata(self, stepid: int) -> StepData:
         try:
             time = self.h5[f'{self.stepgroup[stepid]}/timeinfo/level'][0]
         except KeyError:
@@ -370,8 +433,8 @@ class IFEMReader(Reader):
 
         # Delete the bases we don't need
         if config.only_bases:
-            keep = {b.lower() for b in config.only_bases} | {config.coords.name.lower()}
-            self.bases = {name: basis for name, basis in self.bases.items() if name.lower() in keep}
+            keep = frozenset(b.casefold() for b in config.only_bases) | {config.coords.name.casefold()}
+            self.bases = {name: basis for name, basis in self.bases.items() if name.casefold() in keep}
 
         # Debug output
         for basis in self.bases.values():
@@ -381,19 +444,22 @@ class IFEMReader(Reader):
         """Discover fields and populate the contents of self.fields."""
         for stepid, _ in self.steps():
             stepgrp = self.h5[str(self.stepgroup[stepid])]
-            for basisname, basisgrp in stepgrp.items():
+            # Iterate names only and skip before indexing: items()
+            # would construct a group proxy even for bases we ignore
+            for basisname in stepgrp:
                 if basisname not in self.bases:
                     continue
+                basisgrp = stepgrp[basisname]
 
                 for fieldname in basisgrp.get('fields', ()):
                     if fieldname not in self._fields and basisname in self.bases:
-                        if config.field_filter is not None and fieldname.lower() not in config.field_filter:
+                        if config.field_filter is not None and fieldname.casefold() not in config.field_filter:
                             continue
                         self._fields[fieldname] = IFEMField(fieldname, self.bases[basisname], self)
                         self._field_basis[fieldname] = basisname
                 for fieldname in basisgrp.get('knotspan', ()):
                     if fieldname not in self._fields and basisname in self.bases:
-                        if config.field_filter is not None and fieldname.lower() not in config.field_filter:
+                        if config.field_filter is not None and fieldname.casefold() not in config.field_filter:
                             continue
                         self._fields[fieldname] = IFEMField(fieldname, self.bases[basisname], self, cells=True)
                         self._field_basis[fieldname] = basisname
@@ -477,7 +543,7 @@ class IFEMEigenReader(IFEMReader):
     def nsteps(self):
         return len(self.basis_group['Eigenmode'])
 
-    def stepdata(self, stepid: int) -> Dict[str, Any]:
+    def _read_stepdata(self, stepid: int) -> Dict[str, Any]:
         grp = self.basis_group[f'Eigenmode/{stepid+1}']
         if 'Value' in grp:
             return {'value': grp['Value'][0]}
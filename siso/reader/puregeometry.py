@@ -79,7 +79,7 @@ class G2Reader(PureGeometryReader):
 
     def patches(self):
         with save_excursion(self.f):
-            for i, (topo, data) in enumerate(SplineTopology.from_string(self.f.read())):
+            for i, (topo, data) in enumerate(SplineTopology.from_stream(self.f)):
                 yield Patch((i,), topo), data
 
 
@@ -94,5 +94,5 @@ class LRReader(PureGeometryReader):
 
     def patches(self):
         with save_excursion(self.f):
-            for i, (topo, data) in enumerate(LRTopology.from_string(self.f.read())):
+            for i, (topo, data) in enumerate(LRTopology.from_stream(self.f)):
                 yield Patch((i,), topo), data
@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from datetime import datetime
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 import netCDF4
@@ -18,7 +18,7 @@ from ..coords import Local, Geocentric, Geodetic, Coords
 from ..coords.util import spherical_cartesian_vf
 from ..fields import Field, SimpleField, Geometry, FieldPatches
 from ..geometry import Quad, Hex, StructuredTopology, UnstructuredTopology, Patch
-from ..util import unstagger, structured_cells, angle_mean_deg, nodemap as mknodemap, flatten_2d
+from ..util import cache, unstagger, structured_cells, angle_mean_deg, nodemap as mknodemap, flatten_2d
 from ..writer import Writer
 
 
@@ -56,26 +56,36 @@ class WRFVectorField(SimpleField):
         self.reader = reader
         self.ncomps = len(components)
 
+    def component_array(self, stepid: int, **kwargs) -> Array2D:
+        """Read the component variables into one preallocated (n, 3) array
+        instead of stacking and transposing three flattened copies.
+        """
+        comps = [self.reader.variable_at(x, stepid, **kwargs) for x in self.components]
+        data = np.empty((comps[0].size, len(comps)), dtype=np.result_type(*comps))
+        for i, comp in enumerate(comps):
+            data[:, i] = comp.reshape(-1)
+        return data
+
     def patches(self, stepid: int, force: bool = False, coords: Optional[Coords] = None) -> FieldPatches:
         kwargs = {'extrude_if_planar': config.volumetric == 'extrude'}
 
         if isinstance(coords, Local):
-            data = np.array([self.reader.variable_at(x, stepid, **kwargs).flatten() for x in 'UVW']).T
-            yield self.reader.patch_at(stepid), data; return
+            yield self.reader.patch_at(stepid), self.component_array(stepid, **kwargs); return
 
-        data = np.array([self.reader.variable_at(x, stepid, include_poles=False, **kwargs).flatten() for x in 'UVW']).T
+        data = self.component_array(stepid, include_poles=False, **kwargs)
         reader = self.reader
 
         # Convert to structured shape
         data = data.reshape((-1, reader.nlat, reader.nlon, 3))
 
         # Convert to rotated geocentric coordinates
-        lon = self.reader.variable_at('XLONG', stepid, include_poles=False)
-        lat = self.reader.variable_at('XLAT', stepid, include_poles=False)
+        lon = np.deg2rad(self.reader.variable_at('XLONG', stepid, include_poles=False))
+        lat = np.deg2rad(self.reader.variable_at('XLAT', stepid, include_poles=False))
+        clat = np.cos(lat)
         pts = np.array([
-            (np.cos(np.deg2rad(lon)) * np.cos(np.deg2rad(lat))).flatten(),
-            (np.sin(np.deg2rad(lon)) * np.cos(np.deg2rad(lat))).flatten(),
-            np.sin(np.deg2rad(lat)).flatten(),
+            (np.cos(lon) * clat).flatten(),
+            (np.sin(lon) * clat).flatten(),
+            np.sin(lat).flatten(),
         ]).T
         pts = reader.rotation(with_intrinsic=True).inv().apply(pts)
         lon = np.rad2deg(np.arctan2(pts[:,1], pts[:,0]))
@@ -84,16 +94,20 @@ class WRFVectorField(SimpleField):
 
         # Extract mean values at poles
         if config.periodic:
-            south = np.mean(data[:, 0, ...], axis=-2)[:, __, :]
-            north = np.mean(data[:, -1, ...], axis=-2)[:, __, :]
+            south = np.mean(data[:, 0, ...], axis=-2)
+            north = np.mean(data[:, -1, ...], axis=-2)
 
         # Flatten the horizontal directions
         data = data.reshape((-1, reader.nlat * reader.nlon, 3))
 
-        # Append mean values at poles
+        # Append mean values at poles, preallocating the final shape
+        # instead of copying the full array once per np.append
         if config.periodic:
-            data = np.append(data, south, axis=1)
-            data = np.append(data, north, axis=1)
+            newdata = np.empty((data.shape[0], data.shape[1] + 2, 3), dtype=data.dtype)
+            newdata[:, :-2] = data
+            newdata[:, -2] = south
+            newdata[:, -1] = north
+            data = newdata
 
         # Rotate to true geocentric coordinates
         data = reader.rotation().apply(flatten_2d(data)).reshape(data.shape)
@@ -127,7 +141,10 @@ class WRFGeometryField(SimpleField):
             # PLANAR: Use the terrain height according to the dataset.
             return x, y, self.reader.variable_at(self.heightname, stepid)
         # VOLUMETRIC: Compute the height using geopotential fields.
-        z = (self.reader.variable_at('PH', stepid) + self.reader.variable_at('PHB', stepid)) / 9.81
+        # The sum is a fresh array, so divide it in place rather than
+        # allocating a second full-size temporary.
+        z = self.reader.variable_at('PH', stepid) + self.reader.variable_at('PHB', stepid)
+        z /= 9.81
         return x[__, ...], y[__, ...], z
 
     def patches(self, stepid: int, force: bool = False, **_) -> FieldPatches:
@@ -151,10 +168,12 @@ class WRFLocalGeometryField(WRFGeometryField):
 
     def nodes(self, stepid: int) -> Array2D:
         reader = self.reader
-        x = np.arange(reader.nlon) * reader.nc.DX
-        y = np.arange(reader.nlat) * reader.nc.DY
-        x, y = np.meshgrid(x, y)
-        return self.height(stepid, x.flatten(), y.flatten())
+        # Tile and repeat the coordinate ramps directly instead of
+        # materializing two full 2D meshgrid arrays and flattening
+        # (i.e. copying) them again
+        x = np.tile(np.arange(reader.nlon) * reader.nc.DX, reader.nlat)
+        y = np.repeat(np.arange(reader.nlat) * reader.nc.DY, reader.nlon)
+        return self.height(stepid, x, y)
 
 
 class WRFGeodeticGeometryField(WRFGeometryField):
@@ -170,6 +189,14 @@ class WRFGeodeticGeometryField(WRFGeometryField):
         return self.height(stepid, lon, lat)
 
 
+# Recognized horizontal/vertical dimension tuples, after staggering
+# has been normalized away
+VARIABLE_TYPES = {
+    ('south_north', 'west_east'): 'planar',
+    ('bottom_top', 'south_north', 'west_east'): 'volumetric',
+}
+
+
 class NetCDFHelper(Reader):
 
     nc: netCDF4.Dataset
@@ -179,6 +206,7 @@ class NetCDFHelper(Reader):
 
     def __init__(self, filename: Path):
         self.filename = filename
+        self._variable_types = dict()
 
     def __enter__(self):
         self.nc = netCDF4.Dataset(self.filename, 'r').__enter__()
@@ -192,12 +220,17 @@ class NetCDFHelper(Reader):
         """Number of time steps in the dataset."""
         return len(self.nc.dimensions['Time'])
 
-    @property
+    # The dimension sizes are fixed once the file is open, but the
+    # properties are consulted constantly (mesh construction, variable
+    # extraction), so avoid going through the netCDF4 dimension table
+    # on every access.
+
+    @cached_property
     def nlat(self) -> int:
         """Number of points in latitudinal direction."""
         return len(self.nc.dimensions['south_north'])
 
-    @property
+    @cached_property
     def nlon(self) -> int:
         """Number of points in longitudinal direction."""
         return len(self.nc.dimensions['west_east'])
@@ -214,7 +247,7 @@ class NetCDFHelper(Reader):
         """
         return self.nlat * self.nlon
 
-    @property
+    @cached_property
     def nvert(self) -> int:
         """Number of points in vertical direction."""
         return 1
@@ -226,6 +259,15 @@ class NetCDFHelper(Reader):
 
     def variable_type(self, name: str) -> Optional[str]:
         """Check if a variable is volumetric, planar or none of the above."""
+        # fields() classifies every variable in the file each time it
+        # is called, so remember the answer per variable
+        try:
+            return self._variable_types[name]
+        except KeyError:
+            self._variable_types[name] = vtype = self._classify_variable(name)
+            return vtype
+
+    def _classify_variable(self, name: str) -> Optional[str]:
         try:
             time, *dimensions = self.nc[name].dimensions
         except IndexError:
@@ -234,24 +276,20 @@ class NetCDFHelper(Reader):
         if time != 'Time':
             return None
 
-        try:
-            assert len(dimensions) == 2
-            assert dimensions[0].startswith('south_north')
-            assert dimensions[1].startswith('west_east')
-            return 'planar'
-        except AssertionError:
-            pass
+        # Normalize away staggering and dispatch on the dimension
+        # tuple instead of walking an assertion chain per candidate
+        dims = tuple(dim[:-5] if dim.endswith('_stag') else dim for dim in dimensions)
+        return VARIABLE_TYPES.get(dims)
 
-        try:
-            assert len(dimensions) == 3
-            assert dimensions[0].startswith('bottom_top')
-            assert dimensions[1].startswith('south_north')
-            assert dimensions[2].startswith('west_east')
-            return 'volumetric'
-        except AssertionError:
-            pass
+    @cache(4)
+    def raw_variable_at(self, name: str, stepid: int) -> np.ndarray:
+        """Read a variable at a given time step, caching the result.
 
-        return None
+        The same variables are requested several times per step — the
+        coordinate fields in particular — and every netCDF4 read pays
+        for chunk access and mask conversion.
+        """
+        return self.nc[name][stepid, ...]
 
     def variable_at(self, name: str, stepid: int,
                     include_poles: bool = True,
@@ -274,7 +312,7 @@ class NetCDFHelper(Reader):
         time, *dimensions = self.nc[name].dimensions
         dimensions = list(dimensions)
         assert time == 'Time'
-        data = self.nc[name][stepid, ...]
+        data = self.raw_variable_at(name, stepid)
 
         # Detect staggered axes and un-stagger them
         for i, dim in enumerate(dimensions):
@@ -304,16 +342,24 @@ class NetCDFHelper(Reader):
         else:
             data = data.flatten()
 
-        # If periodic, append previously computed polar values
+        # If periodic, append previously computed polar values into a
+        # single preallocated array instead of np.append, which copies
+        # the whole variable again
         if include_poles and config.periodic:
-            appendix = np.array([south, north]).T
-            data = np.append(data, appendix, axis=-1)
+            # Follow the usual promotion rules: the polar means may be
+            # double precision even when the variable itself is not
+            dtype = np.result_type(data.dtype, np.asarray(south).dtype)
+            newdata = np.empty(data.shape[:-1] + (data.shape[-1] + 2,), dtype=dtype)
+            newdata[..., :-2] = data
+            newdata[..., -2] = south
+            newdata[..., -1] = north
+            data = newdata
 
-        # Extrude the vertical direction if desired
+        # Extrude the vertical direction if desired.  The broadcast is
+        # a zero-copy view; consumers that need contiguous data copy
+        # when they reshape.
         if extrude_if_planar and len(dimensions) == 2:
-            newdata = np.zeros((self.nvert,) + data.shape, dtype=data.dtype)
-            newdata[...] = data
-            data = newdata
+            data = np.broadcast_to(data, (self.nvert,) + data.shape)
 
         return data
 
@@ -321,7 +367,12 @@ class NetCDFHelper(Reader):
         """Construct the patch object at the given time step.  This method
         handles all variations of mesh options.
         """
+        # The topology depends only on the grid shape and the mesh
+        # options, so it's the same for every step and every field
+        return self._patch()
 
+    @cache(1)
+    def _patch(self) -> Patch:
         nnodes = self.nplanar
         if config.periodic:
             nnodes += 2
@@ -447,11 +498,12 @@ class WRFReader(NetCDFHelper):
         for stepid in range(self.nsteps):
             yield stepid, {'time': self.nc['XTIME'][stepid] * 60}
 
-    @property
+    @cached_property
     def nvert(self) -> int:
         """Number of points in vertical direction."""
         return len(self.nc.dimensions['bottom_top'])
 
+    @cache(2)
     def rotation(self, with_intrinsic: bool = True) -> Rotation:
         """Return a rotation that sends the north pole to the grid's
         north pole, the south pole to the grid's south pole and the
@@ -459,6 +511,9 @@ class WRFReader(NetCDFHelper):
 
         This is step 2 of the two-step coordinate transform outlined
         in the beginning of the file.
+
+        The rotation depends only on file-level constants, so it is
+        memoized rather than reconstructed for every step.
         """
 
         # Note: the final rotation around Z is essentially guesswork.
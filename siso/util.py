@@ -2,6 +2,7 @@ from contextlib import contextmanager
 from functools import partial, wraps
 from itertools import product, chain
 from operator import attrgetter
+import re
 
 import cachetools
 from cachetools.keys import hashkey
@@ -88,11 +89,15 @@ def ensure_ncomps(data, ncomps: int, allow_scalar: bool):
         return data
     if data.shape[-1] >= ncomps:
         return data
-    return np.hstack([data, np.zeros((data.shape[0], ncomps - data.shape[-1]), dtype=data.dtype)])
+    # Write into one preallocated array instead of stacking a zero
+    # block onto the data (which allocates twice)
+    retval = np.zeros((data.shape[0], ncomps), dtype=data.dtype)
+    retval[:, :data.shape[-1]] = data
+    return retval
 
 
 def bounding_box(data):
-    return tuple((np.min(data[:,i]), np.max(data[:,i])) for i in range(data.shape[1]))
+    return tuple(zip(data.min(axis=0), data.max(axis=0)))
 
 
 T = TypeVar('T')
@@ -226,6 +231,13 @@ def angle_mean_deg(data):
     return np.rad2deg(np.arctan2(np.mean(np.sin(data)), np.mean(np.cos(data))))
 
 
+_COMMA_SPLIT = re.compile(r'\s*,\s*')
+
 def split_commas(strings: Iterable[str]) -> Iterable[str]:
+    """Split each string on commas, stripping surrounding whitespace and
+    discarding empty tokens.
+    """
     for s in strings:
-        yield from s.split(',')
+        for token in _COMMA_SPLIT.split(s.strip()):
+            if token:
+                yield token
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from functools import partial
+from functools import lru_cache, partial
 from inspect import isabstract
 from pathlib import Path
 
@@ -35,8 +35,13 @@ class Writer(Sink, StepSink):
         return False
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def find_applicable(fmt: str) -> type:
-        """Return a writer subclass that can handle the given format."""
+        """Return a writer subclass that can handle the given format.
+
+        Unlike readers, applicability depends only on the format
+        string, so the subclass scan is memoized per format.
+        """
         for cls in subclasses(Writer, invert=True):
             if isabstract(cls):
                 continue